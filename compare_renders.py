@@ -9,42 +9,256 @@ Requirements:
     - uv (https://github.com/astral-sh/uv)
     - pypdfium2 (installed via uv)
     - Pillow (installed via uv)
-    - pixelmatch (for perceptual diffing)
+    - numpy (for vectorized pixel diffing)
     - Rust CLI built at ./target/release/pdf-handler
 """
 
 import argparse
+import importlib.util
+import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
-import json
+from collections import deque
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
 
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
 #     "pypdfium2>=4.30.0",
 #     "pillow>=10.0.0",
-#     "pixelmatch>=0.3.0",
+#     "numpy>=1.26.0",
+#     "orjson>=3.9.0",
+#     "tqdm>=4.66.0",
 # ]
 # ///
 
-try:
-    import pypdfium2 as pdfium
+# Heavy dependencies are imported lazily inside the functions that use them,
+# so --help and fully cached runs don't pay their import cost
+REQUIRED_MODULES = ["numpy", "orjson", "pypdfium2", "PIL", "tqdm"]
+
+
+def _check_deps() -> None:
+    """Exit with a helpful message if a dependency is missing (without importing it)."""
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"Error: Missing dependency: {', '.join(missing)}")
+        print("This script uses inline script metadata for uv.")
+        print("Run with: uv run compare_renders.py")
+        sys.exit(1)
+
+
+def load_json(path: Path):
+    """Load a JSON file."""
+    import orjson
+
+    return orjson.loads(path.read_bytes())
+
+
+def dump_json(obj, path: Path) -> None:
+    """Write obj to path as indented JSON."""
+    import orjson
+
+    path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+
+# Per-channel difference above which a pixel counts as different (0.1 * 255)
+DIFF_THRESHOLD = 25
+DIFF_COLOR = (255, 0, 0, 255)
+SAME_COLOR = (255, 255, 255, 64)
+
+# Per-thread diff image buffers, reused across pages of the same size
+_diff_buffers = threading.local()
+
+
+def _diff_buffer(width: int, height: int) -> "np.ndarray":
+    """Return this thread's RGBA diff buffer, reallocating only on size change."""
+    import numpy as np
+
+    buf = getattr(_diff_buffers, "buf", None)
+    if buf is None or buf.shape[:2] != (height, width):
+        buf = np.empty((height, width, 4), dtype=np.uint8)
+        _diff_buffers.buf = buf
+    return buf
+
+
+def _over_white(arr: "np.ndarray") -> "np.ndarray":
+    """
+    Flatten an RGB or RGBA pixel array to RGB, compositing over white.
+
+    Matches pixelmatch, which the diff replaced: each pixel is blended with
+    white by its alpha before comparing, so a transparent background equals
+    an opaque white one. RGB and fully opaque RGBA come back as views (no
+    copy).
+    """
+    import numpy as np
+
+    if arr.shape[2] == 3:
+        return arr
+    rgb, alpha = arr[..., :3], arr[..., 3:]
+    if alpha.min() == 255:
+        return rgb
+    # rgb*a/255 + 255*(1 - a/255), rounded, in integer arithmetic
+    inv = (255 - rgb.astype(np.uint16)) * alpha
+    return (255 - (inv + 127) // 255).astype(np.uint8)
+
+
+# zlib level for intermediate PNGs: favour encode speed over file size
+PNG_COMPRESS_LEVEL = 1
+
+
+def png_dims(path: Path) -> tuple[int, int]:
+    """Read (width, height) from a PNG's IHDR chunk without decoding it."""
+    with open(path, 'rb') as f:
+        data = f.read(24)
+
+    if len(data) < 24 or data[12:16] != b'IHDR':
+        raise ValueError(f"Not a PNG file: {path}")
+
+    return int.from_bytes(data[16:20], 'big'), int.from_bytes(data[20:24], 'big')
+
+
+def _render_pdfium_page(
+    pdf,
+    page_num: int,
+    dpi: int,
+    target_size: Optional[tuple] = None,
+) -> "Image.Image":
+    """Render one page of an open PdfDocument, resized to target_size if given."""
+    import pypdfium2.raw as pdfium_c
     from PIL import Image
-    from pixelmatch.contrib.PIL import pixelmatch
-except ImportError as e:
-    print(f"Error: Missing dependency: {e}")
-    print("This script uses inline script metadata for uv.")
-    print("Run with: uv run compare_renders.py")
-    sys.exit(1)
+
+    page = pdf[page_num]
+
+    # Render page to an opaque 3-channel bitmap in RGB byte order, so
+    # to_pil() needs no channel swap and no alpha is carried around
+    bitmap = page.render(
+        scale=dpi / 72.0,  # PDFium uses 72 DPI as base
+        rotation=0,
+        force_bitmap_format=pdfium_c.FPDFBitmap_BGR,
+        rev_byteorder=True,
+    )
+
+    # Convert to PIL Image
+    pil_image = bitmap.to_pil()
+
+    # If target size provided, resize to match exactly
+    if target_size:
+        target_width, target_height = target_size
+        dw = abs(pil_image.width - target_width)
+        dh = abs(pil_image.height - target_height)
+        if (dw, dh) != (0, 0):
+            # Off-by-a-pixel rounding differences don't need a full Lanczos pass
+            resample = Image.BILINEAR if max(dw, dh) <= 2 else Image.LANCZOS
+            pil_image = pil_image.resize((target_width, target_height), resample)
+
+    return pil_image
+
+
+def _save_pdfium_page(pdf_dir: Path, page_num: int, pil_image: "Image.Image") -> dict:
+    """Save one rendered PDFium page as {page_num}.png and return its manifest entry."""
+    pil_image.save(pdf_dir / f"{page_num}.png", "PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return {
+        "page": page_num,
+        "file": f"{page_num}.png",
+        "width": pil_image.width,
+        "height": pil_image.height,
+    }
+
+
+# PDFium is not thread-safe, so parallel renders use worker processes that
+# each open the document once and keep it for every page they render
+_worker_pdf = None
+
+
+def _init_render_worker(pdf_path: str) -> None:
+    global _worker_pdf
+    import pypdfium2 as pdfium
+
+    _worker_pdf = pdfium.PdfDocument(pdf_path)
+
+
+def _render_worker_page(
+    pdf_dir: Path,
+    page_num: int,
+    page_count: int,
+    dpi: int,
+    target_size: tuple,
+) -> dict:
+    """Render and save one page in a worker; only its manifest entry goes back."""
+    if len(_worker_pdf) != page_count:
+        raise ValueError(
+            f"Page count mismatch: rust={page_count}, pdfium={len(_worker_pdf)}"
+        )
+
+    pil_image = _render_pdfium_page(_worker_pdf, page_num, dpi, target_size)
+    return _save_pdfium_page(pdf_dir, page_num, pil_image)
+
+
+def iter_pdfium_pages(
+    pdf_path: Path,
+    pdf_dir: Path,
+    dpi: int = 300,
+    target_sizes: Optional[List[tuple]] = None,
+) -> Iterator[tuple[int, "Image.Image"]]:
+    """
+    Render PDF pages with PDFium one at a time.
+
+    Each page is saved as {page_num}.png before it is yielded as
+    (page_num, image), so only the page being consumed stays in memory.
+    index.json is written once the last page has been saved.
+    """
+    import pypdfium2 as pdfium
+
+    # Create output directory - clean up any partial files from previous incomplete runs
+    if pdf_dir.exists():
+        # Remove any partial PNG files (no index.json means incomplete)
+        for png_file in pdf_dir.glob("*.png"):
+            png_file.unlink()
+
+    pdf_dir.mkdir(parents=True, exist_ok=True)
+
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    pages = []
+
+    try:
+        if target_sizes is not None and len(pdf) != len(target_sizes):
+            raise ValueError(
+                f"Page count mismatch: rust={len(target_sizes)}, pdfium={len(pdf)}"
+            )
+
+        for page_num in range(len(pdf)):
+            target_size = target_sizes[page_num] if target_sizes else None
+            pil_image = _render_pdfium_page(pdf, page_num, dpi, target_size)
+            pages.append(_save_pdfium_page(pdf_dir, page_num, pil_image))
+            yield page_num, pil_image
+    finally:
+        pdf.close()
+
+    # Create manifest
+    manifest = {
+        "backend": "pdfium",
+        "pdf": pdf_path.name,
+        "dpi": dpi,
+        "total_pages": len(pages),
+        "pages": pages,
+    }
+
+    dump_json(manifest, pdf_dir / "index.json")
 
 
 def render_with_pdfium(
     pdf_path: Path,
     pdf_dir: Path,
     dpi: int = 300,
-    target_sizes: Optional[List[tuple]] = None
+    target_sizes: Optional[List[tuple]] = None,
+    render_workers: int = 1,
 ) -> Optional[dict]:
     """
     Render PDF pages using PDFium.
@@ -54,6 +268,9 @@ def render_with_pdfium(
         pdf_dir: Output directory
         dpi: DPI for rendering
         target_sizes: Optional list of (width, height) tuples to match Rust output
+        render_workers: Number of worker processes rendering pages in
+            parallel; each saves its own PNGs. Needs target_sizes for the
+            page count; 1 renders in-process.
 
     Returns manifest dict if rendering was done, None if skipped.
     """
@@ -61,11 +278,13 @@ def render_with_pdfium(
 
     # Check if already rendered (index.json exists means rendering completed)
     if manifest_path.exists():
-        print(f"  PDFium: Skipping {pdf_path.name} (already rendered)")
-        with open(manifest_path, 'r') as f:
-            return json.load(f)
+        return load_json(manifest_path)
 
-    print(f"  PDFium: Rendering {pdf_path.name}...")
+    if render_workers <= 1 or not target_sizes:
+        # Drain the page iterator; it saves every page and the manifest
+        for _ in iter_pdfium_pages(pdf_path, pdf_dir, dpi, target_sizes):
+            pass
+        return load_json(manifest_path)
 
     # Create output directory - clean up any partial files from previous incomplete runs
     if pdf_dir.exists():
@@ -75,39 +294,23 @@ def render_with_pdfium(
 
     pdf_dir.mkdir(parents=True, exist_ok=True)
 
-    pdf = pdfium.PdfDocument(str(pdf_path))
-    pages = []
-
-    for page_num in range(len(pdf)):
-        page = pdf[page_num]
-
-        # Render page to bitmap
-        bitmap = page.render(
-            scale=dpi / 72.0,  # PDFium uses 72 DPI as base
-            rotation=0,
-        )
-
-        # Convert to PIL Image
-        pil_image = bitmap.to_pil()
-
-        # If target sizes provided, resize to match exactly
-        if target_sizes and page_num < len(target_sizes):
-            target_width, target_height = target_sizes[page_num]
-            if (pil_image.width, pil_image.height) != (target_width, target_height):
-                pil_image = pil_image.resize((target_width, target_height), Image.LANCZOS)
-
-        # Save as PNG with page number (0-indexed)
-        output_path = pdf_dir / f"{page_num}.png"
-        pil_image.save(output_path, "PNG")
-
-        pages.append({
-            "page": page_num,
-            "file": f"{page_num}.png",
-            "width": pil_image.width,
-            "height": pil_image.height,
-        })
-
-    pdf.close()
+    page_count = len(target_sizes)
+    workers = min(render_workers, page_count)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_render_worker,
+        initargs=(str(pdf_path),),
+    ) as executor:
+        # executor.map preserves page order; chunks keep per-task overhead low
+        pages = list(executor.map(
+            _render_worker_page,
+            [pdf_dir] * page_count,
+            range(page_count),
+            [page_count] * page_count,
+            [dpi] * page_count,
+            target_sizes,
+            chunksize=max(1, page_count // (workers * 4)),
+        ))
 
     # Create manifest
     manifest = {
@@ -118,8 +321,7 @@ def render_with_pdfium(
         "pages": pages,
     }
 
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    dump_json(manifest, manifest_path)
 
     return manifest
 
@@ -138,11 +340,7 @@ def render_with_rust_cli(
 
     # Check if already rendered (index.json exists means rendering completed)
     if manifest_path.exists():
-        print(f"  Rust CLI: Skipping {pdf_path.name} (already rendered)")
-        with open(manifest_path, 'r') as f:
-            return json.load(f)
-
-    print(f"  Rust CLI: Rendering {pdf_path.name}...")
+        return load_json(manifest_path)
 
     cli_path = Path("./target/release/pdf-handler")
     if not cli_path.exists():
@@ -176,22 +374,30 @@ def render_with_rust_cli(
         raise RuntimeError(f"Rust CLI failed: {result.stderr}")
 
     # Find generated PNG files (CLI outputs as 0001.png, 0002.png, etc.)
-    temp_pngs = sorted(pdf_dir.glob("*.png"))
+    with os.scandir(pdf_dir) as it:
+        temp_pngs = sorted(
+            entry.path for entry in it
+            if entry.is_file() and entry.name.endswith(".png")
+        )
 
-    # Rename to simple page numbers (0.png, 1.png, etc.)
-    pages = []
+    # Rename to simple page numbers (0.png, 1.png, etc.) in two phases so a
+    # CLI output name can never collide with a final page name
     for i, temp_path in enumerate(temp_pngs):
+        os.replace(temp_path, pdf_dir / f".tmp_{i}.png")
+
+    pages = []
+    for i in range(len(temp_pngs)):
         final_path = pdf_dir / f"{i}.png"
-        temp_path.rename(final_path)
+        os.replace(pdf_dir / f".tmp_{i}.png", final_path)
 
         # Get image dimensions
-        with Image.open(final_path) as img:
-            pages.append({
-                "page": i,
-                "file": f"{i}.png",
-                "width": img.width,
-                "height": img.height,
-            })
+        width, height = png_dims(final_path)
+        pages.append({
+            "page": i,
+            "file": f"{i}.png",
+            "width": width,
+            "height": height,
+        })
 
     # Create manifest
     manifest = {
@@ -202,63 +408,75 @@ def render_with_rust_cli(
         "pages": pages,
     }
 
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    dump_json(manifest, manifest_path)
 
     return manifest
 
 
 def compare_images_perceptual(
-    img1_path: Path,
-    img2_path: Path,
+    img1_src: Union[str, Path, "Image.Image"],
+    img2_src: Union[str, Path, "Image.Image"],
     output_path: Path
 ) -> dict:
     """
-    Compare two images using perceptual diff.
+    Compare two images with a vectorized per-channel diff.
+
+    Each source is either a PNG path (str or Path) or an already-decoded image.
 
     Returns:
         dict with comparison metrics
     """
-    img1 = Image.open(img1_path)
-    img2 = Image.open(img2_path)
+    import numpy as np
+    from PIL import Image
 
-    # Convert to RGBA for consistency
-    img1 = img1.convert('RGBA')
-    img2 = img2.convert('RGBA')
+    img1 = img1_src if isinstance(img1_src, Image.Image) else Image.open(img1_src)
+    img2 = img2_src if isinstance(img2_src, Image.Image) else Image.open(img2_src)
 
-    # Ensure same dimensions
+    # Work in RGB or RGBA only (PDFium renders RGB, the Rust CLI writes RGBA)
+    if img1.mode not in ('RGB', 'RGBA'):
+        img1 = img1.convert('RGBA')
+    if img2.mode not in ('RGB', 'RGBA'):
+        img2 = img2.convert('RGBA')
+
+    # Sizes are matched upstream (PDFium renders to the Rust page sizes)
     if img1.size != img2.size:
-        print(f"    WARNING: Size mismatch: {img1.size} vs {img2.size}")
-        # Resize to match for comparison
-        max_width = max(img1.width, img2.width)
-        max_height = max(img1.height, img2.height)
-
-        if img1.size != (max_width, max_height):
-            new_img1 = Image.new('RGBA', (max_width, max_height), (255, 255, 255, 0))
-            new_img1.paste(img1, (0, 0))
-            img1 = new_img1
-
-        if img2.size != (max_width, max_height):
-            new_img2 = Image.new('RGBA', (max_width, max_height), (255, 255, 255, 0))
-            new_img2.paste(img2, (0, 0))
-            img2 = new_img2
-
-    # Create diff image
-    diff_img = Image.new('RGBA', img1.size)
-
-    # Use pixelmatch for perceptual comparison
-    num_diff_pixels = pixelmatch(img1, img2, diff_img, threshold=0.1)
-
-    # Create side-by-side comparison (expected | diff | actual)
-    width = img1.width
-    height = img1.height
-    comparison = Image.new('RGBA', (width * 3, height))
-    comparison.paste(img1, (0, 0))
-    comparison.paste(diff_img, (width, 0))
-    comparison.paste(img2, (width * 2, 0))
-
-    # Save comparison image
-    comparison.save(output_path, "PNG")
+        raise ValueError(f"Size mismatch: {img1.size} vs {img2.size}")
+
+    a, b = _over_white(np.asarray(img1)), _over_white(np.asarray(img2))
+    if np.array_equal(a, b):
+        # Bit-identical pages: skip the per-pixel diff entirely. array_equal
+        # is one extra full-frame pass with a page-sized bool temporary and no
+        # early exit, paid on differing pages too; it saves the diff and
+        # composite work on identical ones
+        num_diff_pixels = 0
+    else:
+        # Vectorized comparison: a pixel differs when any channel is off by
+        # more than the threshold (0.1 * 255)
+        delta = np.abs(a.astype(np.int16) - b).max(axis=2)
+        mask = delta > DIFF_THRESHOLD
+        num_diff_pixels = int(mask.sum())
+
+    if num_diff_pixels == 0:
+        # Identical pages need no side-by-side; write a tiny placeholder so
+        # every page still has a diff image
+        Image.new('RGBA', (1, 1)).save(output_path, "PNG")
+    else:
+        # Build diff image: red for differing pixels, faint white elsewhere
+        diff_arr = _diff_buffer(img1.width, img1.height)
+        diff_arr[...] = SAME_COLOR
+        diff_arr[mask] = DIFF_COLOR
+        diff_img = Image.fromarray(diff_arr, 'RGBA')
+
+        # Create side-by-side comparison (expected | diff | actual)
+        width = img1.width
+        height = img1.height
+        comparison = Image.new('RGBA', (width * 3, height))
+        comparison.paste(img1, (0, 0))
+        comparison.paste(diff_img, (width, 0))
+        comparison.paste(img2, (width * 2, 0))
+
+        # Save comparison image
+        comparison.save(output_path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
 
     total_pixels = img1.width * img1.height
     diff_percentage = (num_diff_pixels / total_pixels) * 100 if total_pixels > 0 else 0
@@ -276,32 +494,52 @@ def compare_images_perceptual(
 def compare_renders(
     pdf_name: str,
     rust_manifest: dict,
-    pdfium_manifest: dict,
+    pdfium_manifest: Optional[dict],
     diff_dir: Path,
+    page_workers: Optional[int] = None,
+    pdfium_images: Optional[Iterator[tuple[int, "Image.Image"]]] = None,
+    show_progress: bool = True,
 ) -> Optional[dict]:
     """
     Compare rendered pages between rust and pdfium backends.
 
+    Pages are compared in parallel threads; page_workers defaults to
+    min(8, cpu_count), with at most twice that many pages in flight.
+    pdfium_images may be an iter_pdfium_pages() iterator: pages are then
+    diffed in memory as they are rendered instead of being decoded from
+    disk, and pdfium_manifest may be None (the iterator checks page counts).
+    show_progress displays a per-page progress bar.
+
     Returns manifest dict if comparison was done, None if skipped.
     """
     manifest_path = diff_dir / "index.json"
 
     # Check if already compared (index.json exists means comparison completed)
     if manifest_path.exists():
-        print(f"  Diff: Skipping {pdf_name} (already compared)")
-        with open(manifest_path, 'r') as f:
-            return json.load(f)
+        return load_json(manifest_path)
 
-    print(f"  Diff: Comparing {pdf_name}...")
+    from tqdm import tqdm
 
-    # Validate page counts
     rust_pages = rust_manifest["total_pages"]
-    pdfium_pages = pdfium_manifest["total_pages"]
 
-    if rust_pages != pdfium_pages:
-        raise ValueError(
-            f"Page count mismatch: rust={rust_pages}, pdfium={pdfium_pages}"
-        )
+    if pdfium_manifest is not None:
+        # Validate page counts
+        pdfium_pages = pdfium_manifest["total_pages"]
+
+        if rust_pages != pdfium_pages:
+            raise ValueError(
+                f"Page count mismatch: rust={rust_pages}, pdfium={pdfium_pages}"
+            )
+
+        # Validate page sizes before decoding anything
+        for rust_page, pdfium_page in zip(rust_manifest["pages"], pdfium_manifest["pages"]):
+            rust_size = (rust_page["width"], rust_page["height"])
+            pdfium_size = (pdfium_page["width"], pdfium_page["height"])
+            if rust_size != pdfium_size:
+                raise ValueError(
+                    f"Page {rust_page['page']} size mismatch: "
+                    f"rust={rust_size}, pdfium={pdfium_size}"
+                )
 
     # Create diff directory - clean up any partial files from previous incomplete runs
     if diff_dir.exists():
@@ -316,29 +554,54 @@ def compare_renders(
     rust_dir = base_dir / "rust"
     pdfium_dir = base_dir / "pdfium"
 
-    # Compare each page
-    page_results = []
-    total_diff_pixels = 0
-
-    for page_num in range(rust_pages):
-        print(f"    Page {page_num + 1}/{rust_pages}...", end=" ", flush=True)
-
-        rust_page_file = rust_dir / f"{page_num}.png"
-        pdfium_page_file = pdfium_dir / f"{page_num}.png"
-        diff_output = diff_dir / f"{page_num}.png"
-
-        result = compare_images_perceptual(
-            pdfium_page_file,  # Expected (reference)
-            rust_page_file,    # Actual
-            diff_output
+    # Expected (reference) pages: in-memory renders, or PNGs on disk
+    if pdfium_images is None:
+        pdfium_images = (
+            (page_num, pdfium_dir / f"{page_num}.png") for page_num in range(rust_pages)
         )
 
-        result["page"] = page_num
-        page_results.append(result)
-        total_diff_pixels += result["diff_pixels"]
+    if page_workers is None:
+        page_workers = min(8, os.cpu_count() or 1)
+    page_workers = max(1, page_workers)
+    max_in_flight = page_workers * 2
 
-        print(f"done ({result['diff_pixels']:,} diff pixels)")
+    page_results = []
+    total_diff_pixels = 0
 
+    # Compare each page (pages are independent, so diff them in parallel).
+    # Pages are submitted as they arrive and collected in order, keeping at
+    # most max_in_flight of them (and their images) alive at once.
+    with ThreadPoolExecutor(max_workers=page_workers) as executor, tqdm(
+        total=rust_pages,
+        desc=f"    {pdf_name}",
+        unit="page",
+        position=1,  # below main's "PDFs" bar
+        leave=False,
+        disable=not show_progress,
+    ) as progress:
+        in_flight = deque()
+
+        def collect() -> None:
+            nonlocal total_diff_pixels
+            page_num, future = in_flight.popleft()
+            result = future.result()
+            result["page"] = page_num
+            page_results.append(result)
+            total_diff_pixels += result["diff_pixels"]
+            progress.update(1)
+
+        for page_num, pdfium_page in pdfium_images:
+            in_flight.append((page_num, executor.submit(
+                compare_images_perceptual,
+                pdfium_page,                   # Expected (reference)
+                rust_dir / f"{page_num}.png",  # Actual
+                diff_dir / f"{page_num}.png",
+            )))
+            if len(in_flight) >= max_in_flight:
+                collect()
+
+        while in_flight:
+            collect()
 
     # Create diff manifest
     manifest = {
@@ -351,8 +614,7 @@ def compare_renders(
         "identical": total_diff_pixels == 0,
     }
 
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    dump_json(manifest, manifest_path)
 
     return manifest
 
@@ -361,9 +623,11 @@ def process_pdf(
     pdf_path: Path,
     output_dir: Path,
     dpi: int,
+    page_workers: Optional[int] = None,
+    show_progress: bool = True,
+    render_workers: int = 1,
 ) -> dict:
     """Process a single PDF and compare renders."""
-    print(f"\nProcessing: {pdf_path.name}")
 
     # Create PDF-specific directory structure
     pdf_stem = pdf_path.stem
@@ -380,16 +644,39 @@ def process_pdf(
         # Extract target sizes from Rust manifest
         target_sizes = [(p["width"], p["height"]) for p in rust_manifest["pages"]]
 
-        # Render with PDFium using Rust dimensions to ensure exact match
-        pdfium_manifest = render_with_pdfium(pdf_path, pdfium_dir, dpi, target_sizes)
-
-        # Compare results
-        diff_manifest = compare_renders(
-            pdf_path.name,
-            rust_manifest,
-            pdfium_manifest,
-            diff_dir,
-        )
+        pdfium_done = (pdfium_dir / "index.json").exists()
+        diff_done = (diff_dir / "index.json").exists()
+
+        # Cached renders, or parallel render workers (which save pages in
+        # their own processes), are diffed from the PNGs on disk; otherwise
+        # each page is diffed in memory as it is rendered
+        if pdfium_done or diff_done or render_workers > 1:
+            # Render with PDFium using Rust dimensions to ensure exact match
+            pdfium_manifest = render_with_pdfium(
+                pdf_path, pdfium_dir, dpi, target_sizes, render_workers
+            )
+
+            # Compare results
+            diff_manifest = compare_renders(
+                pdf_path.name,
+                rust_manifest,
+                pdfium_manifest,
+                diff_dir,
+                page_workers,
+                show_progress=show_progress,
+            )
+        else:
+            # Render and compare in one pass: each PDFium page (sized to
+            # match Rust) is diffed from memory while later pages render
+            diff_manifest = compare_renders(
+                pdf_path.name,
+                rust_manifest,
+                None,
+                diff_dir,
+                page_workers,
+                iter_pdfium_pages(pdf_path, pdfium_dir, dpi, target_sizes),
+                show_progress,
+            )
 
         return {
             "pdf": pdf_path.name,
@@ -411,13 +698,14 @@ def aggregate_results(output_dir: Path) -> dict:
 
     results = []
 
-    # Find all diff manifests
-    diff_manifests = list(output_dir.glob("*/diff/index.json"))
+    # Find all diff manifests (one level deep: <output>/<pdf>/diff/index.json)
+    with os.scandir(output_dir) as it:
+        pdf_dirs = sorted(entry.path for entry in it if entry.is_dir())
 
-    for manifest_path in diff_manifests:
-        with open(manifest_path, 'r') as f:
-            diff_data = json.load(f)
-            results.append(diff_data)
+    for pdf_dir in pdf_dirs:
+        manifest_path = Path(pdf_dir) / "diff" / "index.json"
+        if manifest_path.is_file():
+            results.append(load_json(manifest_path))
 
     # Calculate summary statistics
     total_pdfs = len(results)
@@ -460,9 +748,29 @@ def main():
         default=Path("results"),
         help="Output directory for results (default: results/)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(os.cpu_count() or 1, 4),
+        help="Number of PDFs to process in parallel (default: min(cpu_count, 4))",
+    )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=1,
+        help=(
+            "Total worker processes rendering PDFium pages, split across the PDFs "
+            "processed in parallel (default: 1, in-process). Above 1, PDFium pages "
+            "are written to disk and read back for diffing instead of being diffed "
+            "in memory as they render"
+        ),
+    )
 
     args = parser.parse_args()
 
+    _check_deps()
+    from tqdm import tqdm
+
     # Validate inputs
     if not args.pdf_folder.exists():
         print(f"Error: PDF folder not found: {args.pdf_folder}")
@@ -479,19 +787,37 @@ def main():
     print(f"Output directory: {args.output}")
     print(f"DPI: {args.dpi}")
 
-    # Process each PDF
-    process_results = []
-    for pdf_path in pdf_files:
-        result = process_pdf(pdf_path, args.output, args.dpi)
-        process_results.append(result)
+    # Process PDFs in parallel (each PDF writes only to its own subdirectory)
+    max_workers = max(1, min(args.workers, len(pdf_files)))
+    print(f"Workers: {max_workers}")
+
+    # Cap per-page threads when running several PDFs at once to avoid
+    # oversubscription; per-page progress bars from several workers would
+    # overwrite each other, so only show them for a single worker
+    page_workers = 2 if max_workers > 1 else None
+    # --render-workers is a total budget: split it across concurrent PDFs so
+    # the process count stays at about max(workers, render-workers)
+    render_workers = max(1, args.render_workers // max_workers)
+    show_page_progress = max_workers == 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                process_pdf, pdf_path, args.output, args.dpi,
+                page_workers, show_page_progress, render_workers,
+            )
+            for pdf_path in pdf_files
+        ]
+        # as_completed only drives the progress bar; results keep submission order
+        for _ in tqdm(as_completed(futures), total=len(futures), desc="PDFs", unit="pdf"):
+            pass
+        process_results = [future.result() for future in futures]
 
     # Aggregate results from all diff manifests
     aggregate = aggregate_results(args.output)
 
     # Save aggregate results
     aggregate_file = args.output / "aggregate.json"
-    with open(aggregate_file, 'w') as f:
-        json.dump(aggregate, f, indent=2)
+    dump_json(aggregate, aggregate_file)
 
     # Generate summary
     print("\n" + "="*80)
@@ -3,7 +3,7 @@
 Download PDF files from URLs listed in a file.
 
 Usage:
-    uv run download_pdfs.py [--input compare.txt] [--output test_pdfs/] [--limit 100]
+    uv run download_pdfs.py [--input compare.txt] [--output test_pdfs/] [--limit 100] [--concurrency 16]
 
 Requirements:
     - uv (https://github.com/astral-sh/uv)
@@ -11,10 +11,12 @@ Requirements:
 """
 
 import argparse
+import asyncio
 import hashlib
 import sys
 import tempfile
 from pathlib import Path
+from typing import Literal
 
 # /// script
 # requires-python = ">=3.11"
@@ -32,58 +34,111 @@ except ImportError as e:
     sys.exit(1)
 
 
+DownloadStatus = Literal["ok", "skip", "fail"]
+
+# Size of chunks streamed from the response to disk
+CHUNK_SIZE = 64 * 1024
+
+
 def hash_url(url: str) -> str:
     """Create a SHA256 hash of the URL."""
     return hashlib.sha256(url.encode()).hexdigest()
 
 
-def download_pdf(url: str, output_dir: Path) -> tuple[bool, str]:
+async def download_pdf(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    url: str,
+    output_dir: Path,
+    in_flight: dict[str, "asyncio.Future[DownloadStatus]"],
+    label: str = "",
+) -> tuple[DownloadStatus, str]:
     """
     Download a PDF from URL to temp file, then move to final location.
 
+    The shared client pools connections across downloads; the semaphore
+    bounds how many run at once. in_flight maps each URL hash taken by a
+    download in this run to a future holding its status, so a duplicate URL
+    waits for the first download instead of fetching the file again. label
+    prefixes every log line.
+
     Returns:
-        (success: bool, status: str)
+        (status: "ok" | "skip" | "fail", filename: str)
     """
     # Generate filename from URL hash
     url_hash = hash_url(url)
     final_filename = f"{url_hash}.pdf"
     final_path = output_dir / final_filename
 
-    # Skip if file already exists
+    # Skip if file already exists. The filename derives from the URL alone,
+    # so re-runs short-circuit here without any network request.
     if final_path.exists():
         file_size = final_path.stat().st_size
-        print(f"  ⊙ Already exists: {final_filename} ({file_size:,} bytes)")
-        return True, "skipped"
-
+        print(f"{label} ⊙ Already exists: {final_filename} ({file_size:,} bytes)")
+        return "skip", final_filename
+
+    # Duplicate URL in this run: wait for the first download and report it
+    # the way a sequential run would (skipped if the file now exists, failed
+    # otherwise). No await between lookup and insert, so this is race-free.
+    pending = in_flight.get(url_hash)
+    if pending is not None:
+        if await asyncio.shield(pending) == "fail":
+            print(f"{label} ✗ Duplicate URL, first download failed: {url[:80]}")
+            return "fail", ""
+        print(f"{label} ⊙ Duplicate URL: {final_filename}")
+        return "skip", final_filename
+
+    done: asyncio.Future[DownloadStatus] = asyncio.get_running_loop().create_future()
+    in_flight[url_hash] = done
+    status: DownloadStatus = "fail"
+    try:
+        status, filename = await fetch_pdf(client, sem, url, final_path, label)
+        return status, filename
+    finally:
+        # Always resolve, so duplicates never hang on a cancelled download
+        done.set_result(status)
+
+
+async def fetch_pdf(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    url: str,
+    final_path: Path,
+    label: str = "",
+) -> tuple[DownloadStatus, str]:
+    """Stream url into a temp file next to final_path, then rename it into place."""
+    final_filename = final_path.name
     tmp_path = None
     try:
-        print(f"Downloading: {url[:80]}...")
-
-        with httpx.Client(follow_redirects=True, timeout=30.0) as client:
-            response = client.get(url)
-            response.raise_for_status()
+        async with sem:
+            print(f"{label} Downloading: {url[:80]}...")
 
-            content = response.content
+            # Stream to temp file first so the whole PDF is never held in memory
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
 
-        # Download to temp file first
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.pdf') as tmp:
-            tmp.write(content)
-            tmp_path = Path(tmp.name)
+                # Temp file lives in output_dir so the final rename never crosses filesystems
+                with tempfile.NamedTemporaryFile(
+                    mode='wb', delete=False, suffix='.part', dir=final_path.parent
+                ) as tmp:
+                    tmp_path = Path(tmp.name)
+                    async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
+                        tmp.write(chunk)
 
         # Move to final location
         tmp_path.rename(final_path)
         tmp_path = None  # Moved successfully
 
         file_size = final_path.stat().st_size
-        print(f"  ✓ Saved as {final_filename} ({file_size:,} bytes)")
-        return True, "downloaded"
+        print(f"{label} ✓ Saved as {final_filename} ({file_size:,} bytes)")
+        return "ok", final_filename
 
     except httpx.HTTPError as e:
-        print(f"  ✗ HTTP error: {e}")
-        return False, "failed"
+        print(f"{label} ✗ HTTP error: {e}")
+        return "fail", ""
     except Exception as e:
-        print(f"  ✗ Error: {e}")
-        return False, "failed"
+        print(f"{label} ✗ Error: {e}")
+        return "fail", ""
     finally:
         # Clean up temp file if it still exists
         if tmp_path and tmp_path.exists():
@@ -93,6 +148,19 @@ def download_pdf(url: str, output_dir: Path) -> tuple[bool, str]:
                 pass
 
 
+async def run_all(urls: list[str], output_dir: Path, concurrency: int) -> list[tuple[DownloadStatus, str]]:
+    """Download all URLs concurrently over a single pooled client."""
+    sem = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency * 2)
+    in_flight: dict[str, asyncio.Future[DownloadStatus]] = {}
+
+    async with httpx.AsyncClient(follow_redirects=True, timeout=30.0, limits=limits) as client:
+        return await asyncio.gather(*[
+            download_pdf(client, sem, url, output_dir, in_flight, f"[{i}/{len(urls)}]")
+            for i, url in enumerate(urls, 1)
+        ])
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Download PDF files from a list of URLs"
@@ -115,6 +183,12 @@ def main():
         default=100,
         help="Maximum number of PDFs to download (default: 100)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Maximum number of concurrent downloads (default: 16)",
+    )
 
     args = parser.parse_args()
 
@@ -152,20 +226,17 @@ def main():
     skipped = 0
     failed = 0
 
-    for i, url in enumerate(urls, 1):
-        print(f"[{i}/{len(urls)}]", end=" ")
+    results = asyncio.run(run_all(urls, args.output, max(1, args.concurrency)))
 
-        success, status = download_pdf(url, args.output)
-
-        if success:
-            if status == "downloaded":
-                downloaded += 1
-            elif status == "skipped":
-                skipped += 1
+    for status, _filename in results:
+        if status == "ok":
+            downloaded += 1
+        elif status == "skip":
+            skipped += 1
         else:
             failed += 1
 
-        print()
+    print()
 
     # Summary
     print("=" * 80)